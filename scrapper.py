@@ -1,22 +1,46 @@
 #!/usr/bin/env python3
-import sys, json, re, os, yaml
-from urllib.parse import urlparse, urljoin
+import sys, json, re, os, yaml, atexit, asyncio, collections, queue, threading, functools, shelve, argparse, logging, socket, string, contextlib
+import logging.handlers
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse, urljoin, unquote, quote
 import requests
-from bs4 import BeautifulSoup, Tag
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html  # also backs every BeautifulSoup(..., _PARSER) call; fail at import, not mid-scrape
+from lxml import etree
+import soupsieve as sv
+from rapidfuzz import fuzz
+try:
+    import orjson  # optional: faster CLI output
+except ImportError:
+    orjson = None
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 import time
 
+log = logging.getLogger(__name__)
+
 # -- CONFIGURATION --
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml
+except ImportError:
+    _YamlLoader = yaml.SafeLoader
+
+SELECTORS_PATH = "selectors.yml"
+_PARSER = "lxml"  # C parser for every BeautifulSoup tree we build
+
+@functools.lru_cache(maxsize=None)
 def load_selectors():
     try:
-        with open("selectors.yml") as f:
-            return yaml.safe_load(f)
+        with open(SELECTORS_PATH) as f:
+            return yaml.load(f, Loader=_YamlLoader)
     except FileNotFoundError:
-        print("Warning: selectors.yml not found, using default selectors")
+        log.warning("selectors.yml not found, using default selectors")
         return {
             'default': {
                 'container': 'body',
@@ -26,102 +50,463 @@ def load_selectors():
         }
 
 SELECTORS = load_selectors()
+# Per-host config with the default entry merged underneath, resolved once
+RESOLVED_SELECTORS = {host: {**SELECTORS.get('default', {}), **(cfg or {})}
+                      for host, cfg in SELECTORS.items()}
+
+@functools.lru_cache(maxsize=None)
+def _css(selector):
+    """Compiled soupsieve matcher for a CSS selector, built once per process"""
+    return sv.compile(selector)
+
+# -- DISK CACHE --
+CACHE_PATH = os.environ.get("SCRAPER_CACHE", ".scrape_cache")  # empty disables
+CACHE_TTL = 7 * 86400  # seconds
+COMPANY_TTL = 86400  # whole scrape results go stale sooner than LinkedIn URLs
+VERIFY_MISS_TTL = 86400
+SEARCH_TTL = 30 * 86400  # a company's LinkedIn page rarely moves
+
+class _DiskCache:
+    """Shelve-backed memo shared across runs.
+
+    Entries expire after ``ttl`` seconds unless ``set`` is given its own.
+    """
+    def __init__(self, path, ttl):
+        self.path = path
+        self.ttl = ttl
+        self._db = None
+        self._lock = threading.Lock()
+
+    def _open(self):
+        if self._db is None:
+            self._db = shelve.open(self.path)
+        return self._db
+
+    def get(self, key):
+        if not self.path:
+            return None
+        try:
+            with self._lock:
+                expires, value = self._open()[key]
+        except Exception:
+            return None  # missing, unreadable or from an incompatible run
+        if time.time() > expires:
+            return None
+        return value
+
+    def set(self, key, value, ttl=None):
+        if not self.path:
+            return
+        expires = time.time() + (self.ttl if ttl is None else ttl)
+        try:
+            with self._lock:
+                self._open()[key] = (expires, value)
+        except Exception as e:
+            log.warning("Could not write cache entry %s: %s", key, e)
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+CACHE = _DiskCache(CACHE_PATH, CACHE_TTL)
+atexit.register(CACHE.close)
+
+# -- PATTERNS --
+def _combine(patterns, flags=0):
+    """Fuse single-group patterns into one alternation so the text is scanned once.
+
+    Each alternative keeps its own capture group, so ``match.lastindex - 1``
+    is the index of the pattern that matched.
+    """
+    return re.compile('|'.join(f'(?:{p})' for p in patterns), flags)
+
+# Company size patterns (handle commas and ranges)
+_SIZE_PATTERNS = [
+    r'([\d,]+[-–][\d,]+|\d[\d,]*\+?)\s*employees?',
+    r'Company size[:\s]*([\d,]+[-–][\d,]+|\d[\d,]*\+?)',
+    r'([\d,]+[-–][\d,]+|\d[\d,]*\+?)\s*people?',
+    r'(\d+,\d+|\d+\+?)\s*employees?',
+    r'employees?[:\s]*([\d,]+[-–][\d,]+|\d[\d,]*\+?)',
+]
+_SIZE_COMBINED = _combine(_SIZE_PATTERNS, re.IGNORECASE)
+
+_WS_RE = re.compile(r'\s+')
+_SIZE_CLEAN_RE = re.compile(r'[^\d,\-–+]')
+_TITLE_SPLIT_RE = re.compile(r"[|\-:@–•]")
+
+# Company-name slug cleanup for generated LinkedIn URLs
+_COMPANY_SUFFIX_RE = re.compile(
+    r'\b(?:inc|corp|corporation|company|co|ltd|limited|llc|group|holdings|the|and|&)\b')
+_NONWORD_RE = re.compile(r'[^\w\s-]')
+_SLUG_SEP_RE = re.compile(r'[\s-]+')
+# Marketing affixes around a company name in a domain ("getacme", "acmeapp");
+# the lookarounds leave a domain that is nothing but the affix alone
+_DOMAIN_PREFIX_RE = re.compile(r'^(?:get|my|the|app|web|site|go|try)(?=.)')
+_DOMAIN_SUFFIX_RE = re.compile(r'(?<=.)(?:app|web|site|io|ai|tech|co|inc)$')
+
+# First label of a plain http(s) URL's host, past any "www." prefixes;
+# IPv6 literals and userinfo don't match
+_HOST_RE = re.compile(r'https?://(?:www\.)*([^./:?#@\[\]]+)(?=[./:?#]|$)(?![^/?#]*@)', re.IGNORECASE)
+
+# Deletes ASCII punctuation and whitespace in one C-level pass ('_' counts as a word character)
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation.replace('_', '') + string.whitespace)
+
+# Placeholder text that never makes a usable overview
+_GENERIC_RE = re.compile(
+    r'welcome to|coming soon|under construction|page not found|home page'
+    r'|official website|main page|default page', re.IGNORECASE)
+
+# A LinkedIn company page mentioned anywhere in a page, with its slashes
+# plain or percent-encoded (redirect parameters); group 1 is the slug, which
+# may itself be (doubly) percent-encoded or non-ASCII
+_LI_COMPANY_RE = re.compile(
+    r'''linkedin\.com(?:/|%2F)company(?:/|%2F)((?:[^\s"'&<>/?#%]|%(?!2F|3F|23|26)[0-9A-F]{2})+)''',
+    re.IGNORECASE)
+
+# An absolute LinkedIn company href in raw page bytes; group 1 is the URL
+_LI_HREF_RE = re.compile(
+    rb'''(?<![\w-])href\s*=\s*["']?(https?://(?:[a-z]{2,3}\.)?linkedin\.com/company/[^\s"'&<>/?#]+)''',
+    re.IGNORECASE)
 
 # -- FETCHING --
-def fetch_page(url, use_js=False, wait_selector=None, timeout=10):
-    """Fetch page via Selenium (JS) or Requests (static)."""
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+# Search engines serve their plain HTML results to a full browser UA
+SEARCH_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
+# Shared session so repeated hosts reuse pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": USER_AGENT})
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64,
+                       max_retries=Retry(total=2, backoff_factor=0.3))
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+atexit.register(SESSION.close)
+# Every request passes (connect, read); a host that doesn't accept a
+# connection quickly isn't going to serve the page either
+CONNECT_TIMEOUT = 3.05
+
+# getaddrinfo answers reused for DNS_TTL seconds; a batch run resolves the
+# same few hosts (linkedin.com, the search engines) over and over
+DNS_TTL = 300
+DNS_CACHE_SIZE = 256  # least recently used lookups are dropped past this
+_system_getaddrinfo = socket.getaddrinfo
+_dns_cache = collections.OrderedDict()
+_dns_lock = threading.Lock()
+
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    key = (host, port, family, type, proto, flags)
+    now = time.monotonic()
+    with _dns_lock:
+        hit = _dns_cache.get(key)
+        if hit and hit[0] > now:
+            _dns_cache.move_to_end(key)
+            return hit[1]
+    result = _system_getaddrinfo(host, port, family, type, proto, flags)
+    with _dns_lock:
+        _dns_cache[key] = (now + DNS_TTL, result)
+        _dns_cache.move_to_end(key)
+        if len(_dns_cache) > DNS_CACHE_SIZE:
+            _dns_cache.popitem(last=False)
+    return result
+
+def install_dns_cache():
+    """Route socket.getaddrinfo through the TTL cache for the whole process"""
+    socket.getaddrinfo = _cached_getaddrinfo
+
+@functools.lru_cache(maxsize=None)
+def _chrome_options():
+    """Options shared by every pooled driver, built once"""
+    opts = Options()
+    opts.add_argument("--headless")
+    opts.add_argument("--disable-gpu")
+    opts.add_argument("--no-sandbox")
+    opts.add_argument("--disable-dev-shm-usage")
+    opts.add_argument(f"--user-agent={USER_AGENT}")
+    opts.add_argument("--blink-settings=imagesEnabled=false")
+    opts.add_argument("--disable-extensions")
+    opts.add_argument("--disable-features=TranslateUI")
+    # Return from driver.get() once the DOM is interactive; callers wait
+    # for the specific elements they need
+    opts.page_load_strategy = "eager"
+    # We only read the DOM, so skip images, stylesheets, fonts, plugins and media
+    opts.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+        "profile.managed_default_content_settings.fonts": 2,
+        "profile.managed_default_content_settings.plugins": 2,
+        "profile.managed_default_content_settings.media_stream": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    })
+    return opts
+
+# Subresources the prefs above don't cover (webfonts via CSS, trackers)
+BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf", "*.mp4",
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*",
+]
+
+def _block_heavy_resources(driver):
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+    except Exception as e:
+        log.warning("Could not set blocked URLs: %s", e)
+
+class _DriverPool:
+    """Headless Chrome drivers, started lazily and reused across page loads.
+
+    ``size`` caps how many Chrome processes run at once; it can be changed
+    until the first driver is checked out. A driver is quit and replaced
+    after ``max_uses`` page loads, before a long batch run lets Chrome's
+    memory creep up.
+    """
+
+    def __init__(self, size=4, max_uses=50):
+        self.size = size
+        self.max_uses = max_uses
+        self._idle = queue.Queue()
+        self._slots = None
+        self._drivers = []
+        self._uses = {}
+        self._lock = threading.Lock()
+
+    def checkout(self):
+        """Return an idle driver, starting a new one if none is free."""
+        with self._lock:
+            if self._slots is None:
+                self._slots = threading.BoundedSemaphore(self.size)
+        self._slots.acquire()
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            driver = webdriver.Chrome(options=_chrome_options())
+        except Exception:
+            self._slots.release()
+            raise
+        _block_heavy_resources(driver)
+        with self._lock:
+            self._drivers.append(driver)
+        return driver
+
+    def checkin(self, driver):
+        """Clear per-site state and hand the driver back; drop it if it has died."""
+        try:
+            with self._lock:
+                uses = self._uses[driver] = self._uses.get(driver, 0) + 1
+            if uses >= self.max_uses:
+                self._discard(driver)
+                return
+            driver.delete_all_cookies()
+            try:
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            except Exception:
+                pass  # no storage on about:blank / error pages
+            # Unload the page so its scripts and timers stop while idle
+            driver.get("about:blank")
+            self._idle.put(driver)
+        except Exception:
+            self._discard(driver)
+        finally:
+            self._slots.release()
+
+    def _discard(self, driver):
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+            self._uses.pop(driver, None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close(self):
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+DRIVERS = _DriverPool()
+atexit.register(DRIVERS.close)
+
+# Only build the parts of a page the scraper actually reads. Top-level
+# matches keep their whole subtree, so <body> content stays selectable
+# while <head> scripts/styles are skipped.
+HOMEPAGE_TAGS = SoupStrainer(['title', 'meta', 'a', 'body', 'div', 'section', 'header', 'main'])
+LINKEDIN_TAGS = SoupStrainer(['dt', 'dd', 'title', 'meta', 'section'])
+LINKEDIN_ABOUT = "section[data-section='about'], .org-about-module, dl.overflow-hidden"
+
+def fetch_page(url, use_js=False, wait_selector=None, timeout=10, strainer=None):
+    """Fetch page via Selenium (JS) or Requests (static).
+
+    With ``use_js``, ``wait_selector`` names content a script is expected
+    to add; if it hasn't appeared within ``timeout`` the page is parsed as
+    rendered so far.
+    """
     if use_js:
-        opts = Options()
-        opts.add_argument("--headless")
-        opts.add_argument("--disable-gpu")
-        opts.add_argument("--no-sandbox")
-        opts.add_argument("--disable-dev-shm-usage")
-        opts.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
-        
-        driver = webdriver.Chrome(options=opts)
+        driver = DRIVERS.checkout()
         try:
+            # With the eager load strategy get() returns once the DOM is
+            # interactive; then wait only for the element we need
             driver.get(url)
-            # Wait for page to load
-            time.sleep(3)
             if wait_selector:
+                try:
+                    WebDriverWait(driver, timeout).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, wait_selector)))
+                except TimeoutException:
+                    log.debug("%s did not render %r in time, using current page", url, wait_selector)
+            else:
                 WebDriverWait(driver, timeout).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, wait_selector))
-                )
+                    EC.presence_of_element_located((By.TAG_NAME, "body")))
             html = driver.page_source
         finally:
-            driver.quit()
-        return BeautifulSoup(html, "html.parser")
+            DRIVERS.checkin(driver)
+        return BeautifulSoup(html, _PARSER, parse_only=strainer)
     
-    resp = requests.get(url, headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"})
+    resp = SESSION.get(url, timeout=(CONNECT_TIMEOUT, timeout))
     resp.raise_for_status()
-    return BeautifulSoup(resp.text, "html.parser")
+    # Hand lxml the raw bytes: it decodes in C, and we skip building a
+    # second full-size str via resp.text (and its charset sniffing)
+    declared = 'charset' in resp.headers.get('Content-Type', '').lower()
+    return BeautifulSoup(resp.content, _PARSER, parse_only=strainer,
+                         from_encoding=resp.encoding if declared else None)
 
 # -- HELPER FUNCTIONS --
+def first_linkedin_link(doc, base_url):
+    """First linkedin.com/company/ link in doc, resolved against base_url"""
+    for link in _css('a[href*="linkedin.com"]').select(doc):
+        href = link.get('href')
+        if isinstance(href, list):  # multi-valued attribute
+            href = href[0] if href else None
+        if href and '/company/' in href:
+            return href if href.startswith('http') else urljoin(base_url, href)
+    return None
+
+# Same match as first_linkedin_link, evaluated in C on a bare lxml tree
+_LINKEDIN_HREFS = etree.XPath('//a[contains(@href, "linkedin.com") and contains(@href, "/company/")]/@href')
+
+SUBPAGE_PATHS = [
+    '/about',
+    '/about-us',
+    '/contact',
+    '/contact-us',
+    '/company',
+    '/team',
+    '/careers',
+    '/press',
+    '/media',
+    '/investors',
+    '/footer'  # Sometimes links are in footer
+]
+SUBPAGE_WORKERS = 32  # concurrent probes across all sites being scraped
+# One long-lived pool bounds subpage traffic for the whole process, so a
+# batch run doesn't open SUBPAGE_PATHS connections per company at once
+SUBPAGE_POOL = ThreadPoolExecutor(max_workers=SUBPAGE_WORKERS, thread_name_prefix="subpage")
+SUBPAGE_MAX_BYTES = 512 * 1024  # links live in the markup, not trailing inline bundles
+
+def read_capped(resp, limit):
+    """Read at most about ``limit`` bytes of a streamed response body"""
+    chunks, size = [], 0
+    for chunk in resp.iter_content(64 * 1024):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return b''.join(chunks)
+
+def probe_subpage_for_linkedin(base_url, page_path):
+    """Fetch one subpage and return the LinkedIn company link on it, if any"""
+    try:
+        page_url = urljoin(base_url, page_path)
+        log.debug("Checking %s for LinkedIn links...", page_url)
+        
+        # Use requests for faster checking
+        with SESSION.get(page_url, timeout=(CONNECT_TIMEOUT, 10), stream=True) as resp:
+            if resp.status_code != 200:
+                return None
+            body = read_capped(resp, SUBPAGE_MAX_BYTES)
+        
+        # Most subpages have no LinkedIn link at all; a byte scan rules
+        # them out without building a tree
+        if b'linkedin.com/company/' not in body:
+            return None
+        
+        # The usual absolute footer link is read straight off the bytes;
+        # relative or oddly quoted hrefs still need a tree
+        match = _LI_HREF_RE.search(body)
+        if match:
+            linkedin_url = match.group(1).decode('utf-8', 'replace')
+        else:
+            # Only the href is needed, so skip the soup and let lxml's XPath
+            # return the attribute strings directly
+            hrefs = _LINKEDIN_HREFS(lxml.html.fromstring(body))
+            linkedin_url = urljoin(base_url, hrefs[0]) if hrefs else None
+        if linkedin_url:
+            log.debug("Found LinkedIn URL in %s: %s", page_path, linkedin_url)
+            return linkedin_url
+                    
+    except Exception as e:
+        log.debug("Error checking %s: %s", page_path, e)
+    
+    return None
+
 def find_linkedin_in_subpages(base_url, company_name):
-    """Search for LinkedIn links in common subpages"""
-    common_pages = [
-        '/about',
-        '/about-us',
-        '/contact',
-        '/contact-us',
-        '/company',
-        '/team',
-        '/careers',
-        '/press',
-        '/media',
-        '/investors',
-        '/footer'  # Sometimes links are in footer
-    ]
-    
-    for page_path in common_pages:
-        try:
-            page_url = urljoin(base_url, page_path)
-            print(f"Checking {page_url} for LinkedIn links...")
-            
-            # Use requests for faster checking
-            resp = requests.get(page_url, 
-                              headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"},
-                              timeout=10)
-            
-            if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, 'html.parser')
-                linkedin_links = soup.select('a[href*="linkedin.com"]')
-                
-                for link in linkedin_links:
-                    href = link.get('href')
-                    if href:
-                        href = str(href)
-                        if '/company/' in href:
-                            linkedin_url = href if href.startswith('http') else urljoin(base_url, href)
-                            print(f"Found LinkedIn URL in {page_path}: {linkedin_url}")
-                            return linkedin_url
-                        
-        except Exception as e:
-            print(f"Error checking {page_path}: {e}")
-            continue
+    """Search for LinkedIn links in common subpages.
+
+    All subpages are probed concurrently on the shared SUBPAGE_POOL; the
+    earliest path in SUBPAGE_PATHS that has a link wins, and probes not
+    yet started are cancelled once it is known.
+    """
+    futures = [SUBPAGE_POOL.submit(probe_subpage_for_linkedin, base_url, p) for p in SUBPAGE_PATHS]
+    try:
+        for future in futures:
+            linkedin_url = future.result()
+            if linkedin_url:
+                return linkedin_url
+    finally:
+        for future in futures:
+            future.cancel()
     
     return None
 
+# Name keyword -> LinkedIn slug for companies whose page the guesses miss,
+# in priority order: the first listed keyword found in the name wins, not
+# the one appearing earliest ("Apple and Google" -> google)
+_KNOWN = {
+    'google': 'google',
+    'alphabet': 'google',
+    'apple': 'apple',
+    'microsoft': 'microsoft',
+    'amazon': 'amazon',
+    'meta': 'meta',
+    'facebook': 'meta',
+    'netflix': 'netflix',
+}
+
+def linkedin_slug(company_name):
+    """LinkedIn-style slug for a company name ("Acme Widgets, Inc." -> "acme-widgets")"""
+    # Remove common company suffixes, then special characters
+    clean_name = _COMPANY_SUFFIX_RE.sub('', company_name.lower())
+    clean_name = _NONWORD_RE.sub('', clean_name)
+    # Runs of spaces and dashes become a single dash
+    return _SLUG_SEP_RE.sub('-', clean_name).strip('-')
+
+@functools.lru_cache(maxsize=2048)
 def generate_linkedin_url(company_name):
-    """Generate potential LinkedIn URL from company name"""
+    """Generate potential LinkedIn URLs (a tuple) from company name"""
     if not company_name:
         return None
     
-    # Clean company name for URL
-    clean_name = company_name.lower()
-    
-    # Remove common company suffixes
-    suffixes = ['inc', 'corp', 'corporation', 'company', 'co', 'ltd', 'limited', 
-                'llc', 'group', 'holdings', 'the', 'and', '&']
-    
-    for suffix in suffixes:
-        clean_name = re.sub(rf'\b{suffix}\b', '', clean_name)
-    
-    # Clean up special characters and spaces
-    clean_name = re.sub(r'[^\w\s-]', '', clean_name)
-    clean_name = re.sub(r'\s+', '-', clean_name.strip())
-    clean_name = re.sub(r'-+', '-', clean_name)
-    clean_name = clean_name.strip('-')
+    clean_name = linkedin_slug(company_name)
     
     if clean_name:
         potential_urls = [
@@ -132,74 +517,86 @@ def generate_linkedin_url(company_name):
         ]
         
         # For well-known companies, try common variations
-        if any(x in company_name.lower() for x in ['google', 'alphabet']):
-            potential_urls.append("https://www.linkedin.com/company/google")
-        elif 'apple' in company_name.lower():
-            potential_urls.append("https://www.linkedin.com/company/apple")
-        elif 'microsoft' in company_name.lower():
-            potential_urls.append("https://www.linkedin.com/company/microsoft")
-        elif 'amazon' in company_name.lower():
-            potential_urls.append("https://www.linkedin.com/company/amazon")
-        elif 'meta' in company_name.lower() or 'facebook' in company_name.lower():
-            potential_urls.append("https://www.linkedin.com/company/meta")
-        elif 'netflix' in company_name.lower():
-            potential_urls.append("https://www.linkedin.com/company/netflix")
-        
-        return potential_urls
+        lowered = company_name.lower()
+        slug = next((slug for keyword, slug in _KNOWN.items() if keyword in lowered), None)
+        if slug:
+            potential_urls.append(f"https://www.linkedin.com/company/{slug}")
+        
+        return tuple(potential_urls)
+    
+    return None
+
+# Google Custom Search JSON API credentials; without them we scrape the HTML results
+GOOGLE_CSE_KEY = os.environ.get("GOOGLE_CSE_KEY")
+GOOGLE_CSE_CX = os.environ.get("GOOGLE_CSE_CX")
+GOOGLE_CSE_URL = "https://www.googleapis.com/customsearch/v1"
+
+def search_google_api_for_linkedin(company_name):
+    """Look the company page up through the Custom Search JSON API"""
+    params = {
+        "cx": GOOGLE_CSE_CX,
+        "q": f"{company_name} linkedin.com/company",
+        "fields": "items(link)",
+    }
+    try:
+        log.debug("Querying Google Custom Search for: %s", company_name)
+        # The key goes in a header so it never appears in a logged URL
+        resp = SESSION.get(GOOGLE_CSE_URL, params=params, headers={"X-goog-api-key": GOOGLE_CSE_KEY},
+                           timeout=(CONNECT_TIMEOUT, 5))
+        resp.raise_for_status()
+        for item in resp.json().get('items', []):
+            # Hits can be subpages (/company/acme/jobs?trk=...); keep the company page
+            linkedin_url = linkedin_company_url_in(item.get('link', ''))
+            if linkedin_url:
+                log.debug("Found LinkedIn URL via Google Custom Search: %s", linkedin_url)
+                return linkedin_url
+    except (requests.RequestException, ValueError) as e:
+        log.warning("Error querying Google Custom Search: %s", e)
     
     return None
 
+def linkedin_company_url_in(text):
+    """First LinkedIn company URL in ``text``, normalised to https://www.linkedin.com/company/<slug>"""
+    match = _LI_COMPANY_RE.search(text)
+    if not match:
+        return None
+    # Decode as often as the page encoded it, then percent-encode once
+    slug = match.group(1)
+    while '%' in slug and unquote(slug) != slug:
+        slug = unquote(slug)
+    return f"https://www.linkedin.com/company/{quote(slug, safe='')}"
+
 def search_google_for_linkedin(company_name):
     """Search Google for company LinkedIn page"""
     if not company_name:
         return None
     
+    # The JSON API is a few KB of structured results and never serves a captcha
+    if GOOGLE_CSE_KEY and GOOGLE_CSE_CX:
+        return search_google_api_for_linkedin(company_name)
+    
     # Construct Google search query
     search_query = f"{company_name} linkedin"
     google_url = f"https://www.google.com/search?q={search_query.replace(' ', '+')}"
     
     try:
-        print(f"Searching Google for: {search_query}")
+        log.debug("Searching Google for: %s", search_query)
         
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
-        
-        resp = requests.get(google_url, headers=headers, timeout=10)
+        resp = SESSION.get(google_url, headers=SEARCH_HEADERS, timeout=(CONNECT_TIMEOUT, 10))
         
         if resp.status_code == 200:
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            
-            # Find search result links
-            search_results = soup.find_all('a', href=True)
-            
-            for link in search_results:
-                if isinstance(link, Tag):
-                    href = link.get('href')
-                    if href:
-                        href = str(href)
-                        if 'linkedin.com/company/' in href:
-                            # Extract the actual LinkedIn URL from Google's redirect
-                            if href.startswith('/url?q='):
-                                # Google wraps URLs like: /url?q=https://linkedin.com/company/...&sa=...
-                                import urllib.parse
-                                parsed = urllib.parse.urlparse(href)
-                                actual_url = urllib.parse.parse_qs(parsed.query).get('q')
-                                if actual_url:
-                                    linkedin_url = actual_url[0]
-                                    # Verify it's a valid LinkedIn company URL
-                                    if 'linkedin.com/company/' in linkedin_url:
-                                        print(f"Found LinkedIn URL via Google search: {linkedin_url}")
-                                        return linkedin_url
-                            elif href.startswith('https://linkedin.com/company/') or href.startswith('https://www.linkedin.com/company/'):
-                                print(f"Found LinkedIn URL via Google search: {href}")
-                                return href
-        
-        print("No LinkedIn company page found in Google search results")
+            # Result links carry the target URL unencoded (/url?q=https://...),
+            # so one scan of the raw HTML finds the first company page
+            linkedin_url = linkedin_company_url_in(resp.text)
+            if linkedin_url:
+                log.debug("Found LinkedIn URL via Google search: %s", linkedin_url)
+                return linkedin_url
+        
+        log.debug("No LinkedIn company page found in Google search results")
         return None
         
     except Exception as e:
-        print(f"Error searching Google: {e}")
+        log.warning("Error searching Google: %s", e)
         return None
 
 def search_duckduckgo_for_linkedin(company_name):
@@ -212,117 +609,172 @@ def search_duckduckgo_for_linkedin(company_name):
     ddg_url = f"https://duckduckgo.com/html/?q={search_query.replace(' ', '+')}"
     
     try:
-        print(f"Searching DuckDuckGo for: {search_query}")
-        
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
+        log.debug("Searching DuckDuckGo for: %s", search_query)
         
-        resp = requests.get(ddg_url, headers=headers, timeout=10)
+        resp = SESSION.get(ddg_url, headers=SEARCH_HEADERS, timeout=(CONNECT_TIMEOUT, 10))
         
         if resp.status_code == 200:
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            
-            # Find search result links in DuckDuckGo
-            search_results = soup.find_all('a', {'class': 'result__a'})
-            
-            for link in search_results:
-                if isinstance(link, Tag):
-                    href = link.get('href')
-                    if href:
-                        href = str(href)
-                        if 'linkedin.com/company/' in href:
-                            print(f"Found LinkedIn URL via DuckDuckGo search: {href}")
-                            return href
-        
-        print("No LinkedIn company page found in DuckDuckGo search results")
+            # Result links go through a percent-encoded redirect (uddg=https%3A...)
+            linkedin_url = linkedin_company_url_in(resp.text)
+            if linkedin_url:
+                log.debug("Found LinkedIn URL via DuckDuckGo search: %s", linkedin_url)
+                return linkedin_url
+        
+        log.debug("No LinkedIn company page found in DuckDuckGo search results")
         return None
         
     except Exception as e:
-        print(f"Error searching DuckDuckGo: {e}")
+        log.warning("Error searching DuckDuckGo: %s", e)
         return None
 
+SEARCH_ENGINES = [search_google_for_linkedin, search_duckduckgo_for_linkedin]
+
+@functools.lru_cache(maxsize=2048)
 def search_engines_for_linkedin(company_name):
-    """Try multiple search engines to find LinkedIn company page"""
+    """Try multiple search engines to find LinkedIn company page.
+
+    The engines are queried concurrently; whichever answers first with a
+    company page wins and the other request is abandoned. Hits are kept
+    on disk for SEARCH_TTL, so re-runs over the same names stay off the
+    search engines entirely.
+    """
     if not company_name:
         return None
     
-    # Try Google first
-    linkedin_url = search_google_for_linkedin(company_name)
+    key = f"search:{company_name.lower().strip()}"
+    linkedin_url = CACHE.get(key)
     if linkedin_url:
+        log.debug("Using cached search result for %s: %s", company_name, linkedin_url)
         return linkedin_url
     
-    # If Google fails, try DuckDuckGo
-    print("Google search failed, trying DuckDuckGo...")
-    time.sleep(2)  # Be polite with requests
-    linkedin_url = search_duckduckgo_for_linkedin(company_name)
-    if linkedin_url:
-        return linkedin_url
+    ex = ThreadPoolExecutor(max_workers=len(SEARCH_ENGINES))
+    try:
+        futures = [ex.submit(search, company_name) for search in SEARCH_ENGINES]
+        for future in as_completed(futures):
+            linkedin_url = future.result()
+            if linkedin_url:
+                CACHE.set(key, linkedin_url, ttl=SEARCH_TTL)
+                return linkedin_url
+    finally:
+        ex.shutdown(wait=False, cancel_futures=True)
+    
+    return None
+
+VERIFY_TIMEOUT = 5  # candidates are checked in parallel, so don't wait on a slow tail
+VERIFY_WORKERS = 8  # concurrent checks per candidate list
+
+LINKEDIN_BOT_WALL = 999  # LinkedIn's "not for crawlers" status; says nothing about the page
+VERIFIED, UNVERIFIED = "verified", "unverified"  # check_linkedin_url outcomes besides a miss
+
+def check_linkedin_url(url):
+    """VERIFIED if the LinkedIn URL answers 200, UNVERIFIED on the bot wall, else None.
+
+    Only definite answers (200, 404, 410) are cached across runs.
+    """
+    key = f"verify:{url}"
+    cached = CACHE.get(key)
+    if cached is not None:
+        return VERIFIED if cached else None
+    
+    try:
+        log.debug("Verifying LinkedIn URL: %s", url)
+        # LinkedIn answers HEAD less reliably than GET; streaming means only
+        # the status line and headers are read before the connection is
+        # handed back to the pool
+        with SESSION.get(url, timeout=(CONNECT_TIMEOUT, VERIFY_TIMEOUT),
+                         allow_redirects=True, stream=True) as resp:
+            status = resp.status_code
+        
+        if status == 200:
+            log.debug("Verified LinkedIn URL: %s", url)
+            CACHE.set(key, True)
+            return VERIFIED
+        if status == LINKEDIN_BOT_WALL:
+            # Can't tell; accept it rather than fall through to weaker
+            # guesses, but callers must not persist it as a known page
+            log.debug("LinkedIn refused to verify %s, accepting it unverified", url)
+            return UNVERIFIED
+        log.debug("LinkedIn URL returned %s: %s", status, url)
+        # A missing page stays missing for a while; throttling (429) does not
+        if status in (404, 410):
+            CACHE.set(key, False, ttl=VERIFY_MISS_TTL)
+            
+    except Exception as e:
+        log.debug("Error verifying %s: %s", url, e)
     
     return None
 
 def verify_linkedin_url(linkedin_urls):
-    """Verify if LinkedIn URL(s) exist and return the valid one"""
+    """Return ``(url, outcome)`` for the first LinkedIn URL that checks out.
+
+    ``outcome`` is VERIFIED or UNVERIFIED as from check_linkedin_url, and
+    ``(None, None)`` means none did. Candidates are checked concurrently;
+    the first one in list order that passes wins, and checks not yet
+    started are cancelled.
+    """
     if isinstance(linkedin_urls, str):
         linkedin_urls = [linkedin_urls]
     
     if not linkedin_urls:
-        return None
+        return None, None
     
-    for url in linkedin_urls:
-        try:
-            print(f"Verifying LinkedIn URL: {url}")
-            resp = requests.head(url, 
-                               headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"},
-                               timeout=10,
-                               allow_redirects=True)
-            
-            if resp.status_code == 200:
-                print(f"Verified LinkedIn URL: {url}")
-                return url
-            else:
-                print(f"LinkedIn URL returned {resp.status_code}: {url}")
-                
-        except Exception as e:
-            print(f"Error verifying {url}: {e}")
-            continue
+    if len(linkedin_urls) == 1:
+        outcome = check_linkedin_url(linkedin_urls[0])
+        return (linkedin_urls[0], outcome) if outcome else (None, None)
     
-    return None
+    ex = ThreadPoolExecutor(max_workers=min(VERIFY_WORKERS, len(linkedin_urls)))
+    try:
+        futures = [(url, ex.submit(check_linkedin_url, url)) for url in linkedin_urls]
+        for url, future in futures:
+            outcome = future.result()
+            if outcome:
+                return url, outcome
+    finally:
+        ex.shutdown(wait=False, cancel_futures=True)
+    
+    return None, None
 
 # -- HELPER: Extract name robustly --
+# Company name sources, best first
+COMPANY_NAME_SELECTORS = [
+    'meta[property="og:site_name"]',
+    'meta[name="application-name"]',
+    'meta[name="apple-mobile-web-app-title"]',
+    'meta[property="og:title"]',
+    'meta[name="twitter:title"]',
+    '.company-name',
+    '.brand-name',
+    '.logo-text',
+    'h1.company-name',
+    '[data-testid="company-name"]'
+]
+_COMPANY_NAME_ANY = ', '.join(COMPANY_NAME_SELECTORS)
+
 def extract_name_from_title(doc, url):
 
-    # Strategy 1: Check for common company name meta tags
-    company_name_selectors = [
-        'meta[property="og:site_name"]',
-        'meta[name="application-name"]',
-        'meta[name="apple-mobile-web-app-title"]',
-        'meta[property="og:title"]',
-        'meta[name="twitter:title"]',
-        '.company-name',
-        '.brand-name',
-        '.logo-text',
-        'h1.company-name',
-        '[data-testid="company-name"]'
-    ]
-    
-    for selector in company_name_selectors:
-        element = doc.select_one(selector)
-        if element:
-            if selector.startswith('meta'):
-                name = element.get('content', '').strip()
-            else:
-                name = element.get_text().strip()
-            
-            if name and len(name) > 1 and len(name) < 100:
-                print(f"Found company name via {selector}: {name}")
-                return name
+    # Strategy 1: Check for common company name meta tags. One tree walk
+    # collects every candidate; the best-ranked selector wins
+    best = None
+    for element in _css(_COMPANY_NAME_ANY).select(doc):
+        if element.name == 'meta':
+            name = (element.get('content') or '').strip()
+        else:
+            name = element.get_text().strip()
+        if not (name and len(name) > 1 and len(name) < 100):
+            continue
+        rank = next(i for i, selector in enumerate(COMPANY_NAME_SELECTORS)
+                    if _css(selector).match(element))
+        if best is None or rank < best[0]:
+            best = (rank, name)
+            if rank == 0:
+                break
+    if best:
+        log.debug("Found company name via %s: %s", COMPANY_NAME_SELECTORS[best[0]], best[1])
+        return best[1]
 
     raw = (doc.title.string or "").strip()
-    parts = re.split(r"[|\-:@–•]", raw)
-    parts = [p.strip() for p in parts if p.strip()]
-    host = urlparse(url).hostname or ""
-    domain = host.replace("www.", "").split(".")[0].lower()
+    parts = [p for p in map(str.strip, _TITLE_SPLIT_RE.split(raw)) if p]
+    domain = domain_label(url)
     # match parts containing all words in domain
     for p in parts:
         words = p.lower().split()
@@ -348,21 +800,8 @@ def is_overview_empty_or_insufficient(overview):
         return True
     
     # Check for generic/insufficient descriptions
-    generic_phrases = [
-        "welcome to",
-        "coming soon",
-        "under construction",
-        "page not found",
-        "home page",
-        "official website",
-        "main page",
-        "default page"
-    ]
-    
-    overview_lower = overview.lower()
-    for phrase in generic_phrases:
-        if phrase in overview_lower:
-            return True
+    if _GENERIC_RE.search(overview):
+        return True
     
     # Check if it's just the company name repeated
     if len(overview.split()) < 5:  # Less than 5 words
@@ -371,7 +810,284 @@ def is_overview_empty_or_insufficient(overview):
     return False
 
 # -- LINKEDIN SCRAPING --
-def scrape_linkedin_info(linkedin_url, need_overview=False, extract_name=False):
+# LinkedIn "About" details list headers -> output keys
+LINKEDIN_FIELDS = {
+    'industry': 'industry',
+    'company size': 'companySize',
+    'founded': 'foundedDate',
+}
+# Everything a LinkedIn visit can contribute to a result
+LINKEDIN_KEYS = {*LINKEDIN_FIELDS.values(), 'name', 'overview'}
+
+# [header, value] for every <dt> and the <dd> that follows it, read from the live DOM
+_LINKEDIN_ROWS_JS = """
+return Array.from(document.querySelectorAll('dt')).map(dt => {
+    let dd = dt.nextElementSibling;
+    while (dd && dd.tagName !== 'DD') dd = dd.nextElementSibling;
+    return [dt.innerText, dd ? dd.innerText : null];
+});
+"""
+
+# Raw text of every JSON-LD block on the page
+_LINKEDIN_JSONLD_JS = """
+return Array.from(document.querySelectorAll('script[type="application/ld+json"]')).map(s => s.textContent);
+"""
+
+# outerHTML of the first element matching arguments[0], or null
+_OUTER_HTML_JS = """
+const el = document.querySelector(arguments[0]);
+return el ? el.outerHTML : null;
+"""
+
+# innerText of the first match for each selector in arguments[0] (null when
+# none), followed by document.title
+_FIRST_TEXTS_JS = """
+return arguments[0].map(sel => {
+    const el = document.querySelector(sel);
+    return el ? el.innerText : null;
+}).concat([document.title]);
+"""
+
+_JSONLD_FIELDS = {
+    'industry': 'industry',
+    'numberOfEmployees': 'companySize',
+    'foundingDate': 'foundedDate',
+}
+
+def jsonld_objects(obj):
+    """Yield every object in a parsed JSON-LD blob, descending into lists and @graph"""
+    if isinstance(obj, list):
+        for item in obj:
+            yield from jsonld_objects(item)
+    elif isinstance(obj, dict):
+        yield obj
+        yield from jsonld_objects(obj.get('@graph'))
+
+def jsonld_value(value):
+    """Flatten a JSON-LD property (QuantitativeValue, list, scalar) to a string"""
+    if isinstance(value, dict):
+        low, high = value.get('minValue'), value.get('maxValue')
+        if low is not None:
+            return f"{low}-{high}" if high is not None else f"{low}+"
+        value = value.get('value')
+    elif isinstance(value, list):
+        value = ', '.join(str(v) for v in value if v is not None)
+    return str(value).strip() if value is not None else ''
+
+def linkedin_details_from_jsonld(blobs):
+    """Map Organization JSON-LD properties to industry/size/founded fields"""
+    details = {}
+    for blob in blobs:
+        try:
+            parsed = json.loads(blob)
+        except (TypeError, ValueError):
+            continue
+        for obj in jsonld_objects(parsed):
+            for prop, key in _JSONLD_FIELDS.items():
+                if key not in details:
+                    value = jsonld_value(obj.get(prop))
+                    if value:
+                        details[key] = value
+                        log.debug("Found %s via JSON-LD: %s", key, value)
+    return details
+
+def linkedin_details_from_rows(rows):
+    """Map About (header, value) pairs to industry/size/founded fields"""
+    details = {}
+    for header, value in rows:
+        key = LINKEDIN_FIELDS.get((header or '').strip().lower())
+        if not key or key in details or not value:
+            continue
+        value = _WS_RE.sub(' ', value).strip()
+        if key == 'companySize':
+            # "1,001-5,000 employees" -> "1,001-5,000"
+            match = _SIZE_COMBINED.search(value)
+            value = _SIZE_CLEAN_RE.sub('', match.group(match.lastindex)) if match else ''
+        if value and len(value) > 1:
+            details[key] = value
+            log.debug("Found %s via details list: %s", key, value)
+    return details
+
+def parse_linkedin_details(soup):
+    """Read industry/size/founded from the About dt/dd list in one tree walk"""
+    rows = []
+    for dt in soup.find_all('dt'):
+        dd = dt.find_next_sibling('dd')
+        if dd:
+            rows.append((dt.get_text(strip=True), dd.get_text(' ', strip=True)))
+    return linkedin_details_from_rows(rows)
+
+def fill_linkedin_details(data, soup, page_source):
+    """Complete the size/industry/founded fields in ``data`` from the parsed page"""
+    # Fields still missing after the live DOM reads come from the dt/dd list here
+    if not all(key in data for key in LINKEDIN_FIELDS.values()):
+        for key, value in parse_linkedin_details(soup).items():
+            data.setdefault(key, value)
+    
+    # Company size also appears outside the details list ("N employees"),
+    # so fall back to a regex scan of the About fragment (or the
+    # whole page when we can't find it)
+    if 'companySize' not in data:
+        about = _css(LINKEDIN_ABOUT).select_one(soup)
+        haystack = str(about) if about else page_source
+        match = _SIZE_COMBINED.search(haystack)
+        if match:
+            company_size = match.group(match.lastindex).strip()
+            # Clean up the extracted size
+            company_size = _SIZE_CLEAN_RE.sub('', company_size)
+            data['companySize'] = company_size
+            log.debug("Found company size: %s", company_size)
+
+# Any of these in the DOM means the About block/details list has rendered
+LINKEDIN_READY_SELECTORS = [
+    "dt",
+    "section[data-section='about']",
+    ".company-about-us",
+    "[data-test-id='about-us']",
+    ".org-about-us-organization-description",
+    ".break-words"
+]
+
+LINKEDIN_NAME_SELECTORS = [
+    'h1[data-test-id="company-name"]',
+    'h1.org-top-card-summary__title',
+    'h1.t-24.t-black.t-normal',
+    '.org-top-card-summary__title',
+    'h1',
+    '.company-name',
+    '[data-test-id="company-name"]'
+]
+
+# Common About section containers
+LINKEDIN_OVERVIEW_CONTAINERS = [
+    '.org-about-us-organization-description',
+    '.break-words',
+    '[data-test-id="about-us"]',
+    '.company-about-us',
+    "section[data-section='about'] p",
+    ':is(h1, h2, h3, h4, h5, h6):-soup-contains("About") + *',
+    # The paragraph, not the wrapper: org-about-module also holds the dt/dd list
+    'div[class*="about"] > p',
+]
+LINKEDIN_OVERVIEW_MAX = 1000  # longer text is a whole section run together
+
+def is_plausible_linkedin_name(name):
+    """Reject empty, overlong and placeholder ("Loading...") name candidates"""
+    if not name or len(name) <= 1 or len(name) >= 100:
+        return False
+    return not any(generic in name.lower() for generic in ['loading', 'error', 'page'])
+
+def linkedin_name_from_title(title):
+    """Company name from a "Company Name | LinkedIn" page title"""
+    if title and 'LinkedIn' in title:
+        parts = title.split('|')
+        if len(parts) > 1:
+            company_name = parts[0].strip()
+            if company_name and len(company_name) > 1:
+                log.debug("Found company name from LinkedIn title: %s", company_name)
+                return company_name
+    return None
+
+def linkedin_overview_from_soup(soup):
+    """First substantial About text found in the known containers"""
+    for container in LINKEDIN_OVERVIEW_CONTAINERS:
+        for elem in _css(container).select(soup):
+            text = _WS_RE.sub(' ', elem.get_text()).strip()
+            if (text and 30 < len(text) < LINKEDIN_OVERVIEW_MAX
+                    and not is_overview_empty_or_insufficient(text)):
+                log.debug("Found LinkedIn overview via BeautifulSoup: %s...", text[:100])
+                return text
+    return None
+
+def fetch_static_linkedin(linkedin_url):
+    """GET the public /about/ page, then the page itself; the first with details wins.
+
+    Returns None as soon as LinkedIn answers with its crawler wall, since
+    the other URL will get the same answer.
+    """
+    base_url = linkedin_url.split('?')[0].rstrip('/')
+    if base_url.endswith('/about'):
+        candidates = [base_url + '/']
+    else:
+        candidates = [base_url + '/about/', base_url]
+    
+    for page_url in candidates:
+        try:
+            resp = SESSION.get(page_url, headers=SEARCH_HEADERS, timeout=(CONNECT_TIMEOUT, 8))
+        except requests.RequestException as e:
+            log.debug("Static LinkedIn fetch failed for %s: %s", page_url, e)
+            return None
+        if resp.status_code == LINKEDIN_BOT_WALL:
+            log.debug("LinkedIn refused a static fetch of %s", page_url)
+            return None
+        if resp.status_code == 200 and (b'<dt' in resp.content or b'application/ld+json' in resp.content):
+            return resp
+        log.debug("No static LinkedIn details at %s (HTTP %s)", page_url, resp.status_code)
+    return None
+
+def _try_static_linkedin(linkedin_url, need_overview=False, extract_name=False):
+    """Read the public company page with a plain GET instead of a browser.
+
+    Returns None when LinkedIn answers with its auth wall (HTTP 999) or the
+    HTML lacks any of the requested fields, so the caller can fall back to
+    the Selenium visit.
+    """
+    resp = fetch_static_linkedin(linkedin_url)
+    if resp is None:
+        return None
+    
+    page_source = resp.text
+    soup = BeautifulSoup(page_source, _PARSER)
+    blobs = [script.string for script in _css('script[type="application/ld+json"]').select(soup)]
+    data = linkedin_details_from_jsonld(blobs)
+    fill_linkedin_details(data, soup, page_source)
+    
+    if extract_name:
+        for selector in LINKEDIN_NAME_SELECTORS:
+            elem = _css(selector).select_one(soup)
+            name = elem.get_text(strip=True) if elem else ''
+            if is_plausible_linkedin_name(name):
+                data['name'] = name
+                break
+        else:
+            title = soup.title.get_text() if soup.title else None
+            name = linkedin_name_from_title(title)
+            if name:
+                data['name'] = name
+    
+    if need_overview:
+        overview_text = linkedin_overview_from_soup(soup)
+        if overview_text:
+            data['overview'] = overview_text
+    
+    wanted = ['companySize']
+    if extract_name:
+        wanted.append('name')
+    if need_overview:
+        wanted.append('overview')
+    if not all(key in data for key in wanted):
+        return None
+    log.debug("Read LinkedIn details without a browser: %s", resp.url)
+    return data
+
+def scrape_linkedin_info(linkedin_url, need_overview=False, extract_name=False, cache=True):
+    """Disk-cached front for the LinkedIn scrape; visits that found nothing are not stored.
+
+    The static /about/ page is tried first and Chrome is only started when
+    it does not have everything we need. ``cache=False`` still reads the
+    cache but doesn't store what this visit finds.
+    """
+    key = f"li:{int(need_overview)}{int(extract_name)}:{linkedin_url}"
+    data = CACHE.get(key)
+    if data is None:
+        data = (_try_static_linkedin(linkedin_url, need_overview, extract_name)
+                or _scrape_linkedin_info(linkedin_url, need_overview, extract_name))
+        # An empty result is usually LinkedIn's auth wall; try again next time
+        if cache and 'linkedinError' not in data and data.keys() & LINKEDIN_KEYS:
+            CACHE.set(key, data)
+    return dict(data)
+
+def _scrape_linkedin_info(linkedin_url, need_overview=False, extract_name=False):
     """
     Visit LinkedIn company page to extract:
     - Company size
@@ -380,246 +1096,309 @@ def scrape_linkedin_info(linkedin_url, need_overview=False, extract_name=False):
     - Founded date
     - Overview/About section (if needed)
     """
-    opts = Options()
-    opts.add_argument("--headless")
-    opts.add_argument("--disable-gpu")
-    opts.add_argument("--no-sandbox")
-    opts.add_argument("--disable-dev-shm-usage")
-    opts.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
-    
-    driver = webdriver.Chrome(options=opts)
+    driver = DRIVERS.checkout()
     data = {}
     try:
-        print(f"Accessing LinkedIn URL: {linkedin_url}")
+        log.debug("Accessing LinkedIn URL: %s", linkedin_url)
         driver.get(linkedin_url)
         
-        # Wait for page to load
-        time.sleep(5)
-        
         # Try different selectors for LinkedIn company info
         # LinkedIn often uses different structures
         try:
-            # Wait for any content to load
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "main"))
-            )
-            
-            # Try to find About section or company details
-            about_selectors = [
-                "section[data-section='about']",
-                ".company-about-us",
-                "[data-test-id='about-us']",
-                ".org-about-us-organization-description",
-                ".break-words"
-            ]
+            # Wait for the details list or About section; extract whatever
+            # rendered if neither shows up (e.g. behind an auth wall)
+            try:
+                WebDriverWait(driver, 10).until(EC.any_of(*(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+                    for selector in LINKEDIN_READY_SELECTORS
+                )))
+            except TimeoutException:
+                log.debug("LinkedIn details did not render in time, using current page")
             
-            for selector in about_selectors:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        print(f"Found elements with selector: {selector}")
-                        break
-                except:
-                    continue
+            # Read the structured data, then the details list, straight from
+            # the live DOM; only serialise and re-parse the page when both
+            # come up short
+            blobs = driver.execute_script(_LINKEDIN_JSONLD_JS) or []
+            data.update(linkedin_details_from_jsonld(blobs))
+            if not all(key in data for key in LINKEDIN_FIELDS.values()):
+                rows = driver.execute_script(_LINKEDIN_ROWS_JS) or []
+                for key, value in linkedin_details_from_rows(rows).items():
+                    data.setdefault(key, value)
             
-            # Try to extract company info using various methods
-            page_source = driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
+            page_source = soup = None
+            if need_overview or 'companySize' not in data:
+                # Overview containers can sit anywhere in the page; without
+                # them only the About fragment is worth serialising
+                if not need_overview:
+                    page_source = driver.execute_script(_OUTER_HTML_JS, LINKEDIN_ABOUT)
+                if page_source:
+                    soup = BeautifulSoup(page_source, _PARSER)
+                else:
+                    page_source = driver.page_source
+                    strainer = None if need_overview else LINKEDIN_TAGS
+                    soup = BeautifulSoup(page_source, _PARSER, parse_only=strainer)
+                fill_linkedin_details(data, soup, page_source)
 
             # Extract company name if requested
             if extract_name:
-                name_selectors = [
-                    'h1[data-test-id="company-name"]',
-                    'h1.org-top-card-summary__title',
-                    'h1.t-24.t-black.t-normal',
-                    '.org-top-card-summary__title',
-                    'h1',
-                    '.company-name',
-                    '[data-test-id="company-name"]'
-                ]
-                
-                for selector in name_selectors:
-                    try:
-                        elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                        if elements:
-                            name = elements[0].text.strip()
-                            if name and len(name) > 1 and len(name) < 100:
-                                # Validate it's not generic text
-                                if not any(generic in name.lower() for generic in ['loading', 'error', 'page']):
-                                    print(f"Found LinkedIn company name: {name}")
-                                    data['name'] = name
-                                    break
-                    except Exception as e:
-                        print(f"Error with name selector {selector}: {e}")
-                        continue
+                # One round-trip for every selector's first match plus the title
+                texts = driver.execute_script(_FIRST_TEXTS_JS, LINKEDIN_NAME_SELECTORS) or []
+                for selector, name in zip(LINKEDIN_NAME_SELECTORS, texts):
+                    name = (name or '').strip()
+                    if is_plausible_linkedin_name(name):
+                        log.debug("Found LinkedIn company name via %s: %s", selector, name)
+                        data['name'] = name
+                        break
                 
                 # Fallback: try to extract name from page title
                 if 'name' not in data:
-                    title = driver.title
-                    if title and 'LinkedIn' in title:
-                        # LinkedIn titles are often like "Company Name | LinkedIn"
-                        parts = title.split('|')
-                        if len(parts) > 1:
-                            company_name = parts[0].strip()
-                            if company_name and len(company_name) > 1:
-                                print(f"Found company name from LinkedIn title: {company_name}")
-                                data['name'] = company_name
+                    company_name = linkedin_name_from_title(texts[-1] if texts else None)
+                    if company_name:
+                        data['name'] = company_name
             
             # ENHANCED: Extract overview/about section if needed
             if need_overview:
-                print("Extracting overview from LinkedIn...")
-                overview_patterns = [
-                    r'<p[^>]*class="[^"]*break-words[^"]*"[^>]*>(.*?)</p>',
-                    r'<div[^>]*class="[^"]*org-about-us-organization-description[^"]*"[^>]*>(.*?)</div>',
-                    r'<section[^>]*data-section="about"[^>]*>.*?<p[^>]*>(.*?)</p>',
-                    r'About\s*</h[1-6]>\s*<[^>]*>(.*?)</[^>]*>',
-                    r'<div[^>]*class="[^"]*about[^"]*"[^>]*>(.*?)</div>',
-                ]
-                
-                for pattern in overview_patterns:
-                    match = re.search(pattern, page_source, re.IGNORECASE | re.DOTALL)
-                    if match:
-                        overview_text = match.group(1)
-                        # Clean HTML tags and normalize whitespace
-                        overview_text = re.sub(r'<[^>]+>', '', overview_text)
-                        overview_text = re.sub(r'\s+', ' ', overview_text).strip()
-                        
-                        # Validate the overview text
-                        if (overview_text and 
-                            len(overview_text) > 30 and 
-                            len(overview_text) < 1000 and
-                            not is_overview_empty_or_insufficient(overview_text)):
-                            data['overview'] = overview_text
-                            print(f"Found LinkedIn overview: {overview_text[:100]}...")
-                            break
-                
-                # Alternative approach using BeautifulSoup if patterns fail
-                if 'overview' not in data:
-                    # Look for common About section containers
-                    about_containers = [
-                        '.org-about-us-organization-description',
-                        '.break-words',
-                        '[data-test-id="about-us"]',
-                        '.company-about-us'
-                    ]
-                    
-                    for container in about_containers:
-                        elements = soup.select(container)
-                        for elem in elements:
-                            text = elem.get_text().strip()
-                            if text and len(text) > 30 and not is_overview_empty_or_insufficient(text):
-                                data['overview'] = text
-                                print(f"Found LinkedIn overview via BeautifulSoup: {text[:100]}...")
-                                break
-                        if 'overview' in data:
-                            break
-            
-            # Look for company size patterns (fixed to handle commas and better formatting)
-            size_patterns = [
-                r'([\d,]+[-–][\d,]+|\d[\d,]*\+?)\s*employees?',
-                r'Company size[:\s]*([\d,]+[-–][\d,]+|\d[\d,]*\+?)',
-                r'([\d,]+[-–][\d,]+|\d[\d,]*\+?)\s*people?',
-                r'(\d+,\d+|\d+\+?)\s*employees?',
-                r'employees?[:\s]*([\d,]+[-–][\d,]+|\d[\d,]*\+?)',
-            ]
-            
-            for pattern in size_patterns:
-                match = re.search(pattern, page_source, re.IGNORECASE)
-                if match:
-                    company_size = match.group(1).strip()
-                    # Clean up the extracted size
-                    company_size = re.sub(r'[^\d,\-–+]', '', company_size)
-                    data['companySize'] = company_size
-                    print(f"Found company size: {company_size}")
-                    break
-            
-            # Look for industry (improved patterns for LinkedIn structure)
-            industry_patterns = [
-                r'Industry\s*</dt>\s*<dd[^>]*>\s*([^<]+?)\s*</dd>',
-                r'Industry\s*</dt>\s*<dd[^>]*>\s*([A-Za-z\s&]+?)\s*(?:<|$)',
-                r'<dt[^>]*>Industry</dt>\s*<dd[^>]*>\s*([^<]+?)\s*</dd>',
-                r'Industry\s*\n\s*([A-Za-z\s&]+?)\s*\n',
-                r'Industry[:\s]*\n\s*([A-Za-z\s&]+?)(?:\s*\n|$)',
-                r'"industry"[:\s]*"([^"]+)"',
-                r'Industry[^>]*>\s*([A-Za-z\s&]+?)\s*<',
-                r'Industry\s*([A-Za-z\s&]+?)\s*(?:Company size|Headquarters|Founded|$)',
-            ]
-            
-            for i, pattern in enumerate(industry_patterns):
-                match = re.search(pattern, page_source, re.IGNORECASE | re.DOTALL)
-                if match:
-                    industry = match.group(1).strip()
-                    # Clean up HTML entities and extra whitespace
-                    industry = re.sub(r'&[^;]*;', '', industry)  # Remove HTML entities
-                    industry = re.sub(r'\s+', ' ', industry)  # Normalize whitespace
-                    industry = industry.strip()
-                    
-                    # Validate the industry text - should be reasonable length and contain letters
-                    if (industry and 
-                        len(industry) > 2 and 
-                        len(industry) < 100 and 
-                        re.search(r'[A-Za-z]', industry) and
-                        not re.search(r'[<>"\']', industry)):  # No HTML remnants
-                        data['industry'] = industry
-                        print(f"Found industry with pattern {i}: {industry}")
-                        break
-                    else:
-                        print(f"Pattern {i} matched but invalid: '{industry}'")
-            
-            # If no industry found with patterns, try alternative approach
-            if 'industry' not in data:
-                # Look for the word "Industry" and extract the next meaningful text
-                soup = BeautifulSoup(page_source, 'html.parser')
-                
-                # Try to find dt/dd structure
-                for dt in soup.find_all('dt'):
-                    if dt.get_text().strip().lower() == 'industry':
-                        dd = dt.find_next_sibling('dd')
-                        if dd:
-                            industry_text = dd.get_text().strip()
-                            if industry_text and len(industry_text) > 2:
-                                data['industry'] = industry_text
-                                print(f"Found industry via BeautifulSoup: {industry_text}")
-                                break
+                log.debug("Extracting overview from LinkedIn...")
+                overview_text = linkedin_overview_from_soup(soup)
+                if overview_text:
+                    data['overview'] = overview_text
                     
         except Exception as e:
-            print(f"Error extracting LinkedIn data: {e}")
+            log.warning("Error extracting LinkedIn data: %s", e)
             data['linkedinError'] = str(e)
             
     except Exception as e:
-        print(f"Error accessing LinkedIn: {e}")
+        log.warning("Error accessing LinkedIn: %s", e)
         data['linkedinError'] = str(e)
     finally:
-        driver.quit()
+        DRIVERS.checkin(driver)
     
     return data
 
+# -- HOMEPAGE EXTRACTION --
+OVERVIEW_FALLBACKS = [
+    'meta[name="description"]',
+    'meta[property="og:description"]',
+    'meta[name="twitter:description"]',
+    '.company-description',
+    '.about-us',
+    '.overview'
+]
+
+def parse_selector_config(selector_config):
+    """Split 'selector::attribute' config into (selector, attribute).
+
+    The attribute may be written bare ('content') or as 'attr(content)';
+    without one the element's text is used.
+    """
+    selector, _, attribute = selector_config.partition('::')
+    attribute = attribute or 'text'
+    if attribute.startswith('attr(') and attribute.endswith(')'):
+        attribute = attribute[5:-1]
+    return selector, attribute
+
+def fallback_overview(doc):
+    """Try common meta description selectors"""
+    for fallback in OVERVIEW_FALLBACKS:
+        elem = _css(fallback).select_one(doc)
+        if elem:
+            if fallback.startswith('meta'):
+                overview = elem.get('content', '')
+            else:
+                overview = elem.get_text().strip()
+            if overview:
+                log.debug("Found overview with fallback selector %s: %s...", fallback, overview[:100])
+                return overview
+    return ''
+
+def make_overview_extractor(cfg):
+    """Build an overview extractor specialised for one host's selector config.
+
+    Selector strings are parsed and compiled here, once, rather than on
+    every scrape.
+    """
+    container = _css(cfg.get('container', 'body'))
+    if not cfg.get('overview'):
+        return lambda doc: ''
+    
+    selector, attribute = parse_selector_config(cfg['overview'])
+    matcher = _css(selector)
+    if attribute == 'text':
+        read = lambda element: element.get_text().strip()
+    else:
+        read = lambda element: element.get(attribute, '')
+    
+    def extract_overview(doc):
+        el = container.select_one(doc) or doc
+        element = matcher.select_one(el)
+        if element:
+            overview = read(element)
+            log.debug("Found overview: %s", overview)
+            return overview
+        log.debug("No element found with selector: %s", selector)
+        return fallback_overview(doc)
+    
+    return extract_overview
+
+OVERVIEW_EXTRACTORS = {host: make_overview_extractor(cfg) for host, cfg in RESOLVED_SELECTORS.items()}
+
 # -- ORCHESTRATION --
+# Anything in here means the static HTML can stand in for the rendered page
+STATIC_ENOUGH = (
+    'meta:is([name="description"], [property="og:description"], '
+    '[name="twitter:description"])[content]:not([content=""]), '
+    'a[href*="linkedin.com/company/"]'
+)
+
+RENDER_TIMEOUT = 3  # seconds to wait for a rendered description or LinkedIn link
+
+def fetch_homepage(url, needs_js=False):
+    """Fetch the homepage statically, rendering it in Chrome only when needed.
+
+    The static HTML is kept if it already has a description (plain, Open
+    Graph or Twitter) or a LinkedIn company link; hosts marked
+    ``needs_js`` go straight to Chrome.
+    """
+    if not needs_js:
+        try:
+            doc = fetch_page(url, strainer=HOMEPAGE_TAGS)
+            if _css(STATIC_ENOUGH).select_one(doc):
+                log.debug("Using static HTML for %s", url)
+                return doc
+            log.debug("Static HTML for %s lacks a description and a LinkedIn link, rendering with Chrome", url)
+        except requests.RequestException as e:
+            log.debug("Static fetch of %s failed (%s), rendering with Chrome", url, e)
+    # <body> exists as soon as the DOM is interactive, so wait for the
+    # content a client-rendered page adds instead, but no longer than the
+    # old fixed sleep: many of these pages never render either
+    return fetch_page(url, use_js=True, wait_selector=STATIC_ENOUGH,
+                      timeout=RENDER_TIMEOUT, strainer=HOMEPAGE_TAGS)
+
+def search_for_linkedin(name):
+    """Strategy 3: search Google/DuckDuckGo for the company page.
+
+    Search hits, like links on the site itself, point at pages the engine
+    has crawled, so only generated guesses (strategy 5) are verified.
+    """
+    log.debug("Searching search engines for LinkedIn page of: %s", name)
+    return search_engines_for_linkedin(name)
+
+def guess_and_verify(name):
+    """Strategy 5: generate LinkedIn URLs from the company name and verify them.
+
+    Returns ``(url, outcome)`` like verify_linkedin_url.
+    """
+    potential_urls = generate_linkedin_url(name)
+    return verify_linkedin_url(potential_urls)
+
+def find_linkedin_elsewhere(url, name):
+    """Run strategies 3-5 at once; the first in that order to find a page wins.
+
+    Each strategy is independent network I/O, so overlapping them costs
+    the slowest one's latency rather than the sum. Strategies not yet
+    started are cancelled once the winner is known. Returns ``(url,
+    outcome)``; search and subpage hits count as VERIFIED.
+    """
+    strategies = [(find_linkedin_in_subpages, url, name)]
+    if name:
+        strategies.insert(0, (search_for_linkedin, name))
+        strategies.append((guess_and_verify, name))
+    
+    ex = ThreadPoolExecutor(max_workers=len(strategies))
+    try:
+        futures = [ex.submit(*strategy) for strategy in strategies]
+        for future in futures:
+            found = future.result()
+            # Only strategy 5 reports how its guess was checked
+            linkedin_url, outcome = found if isinstance(found, tuple) else (found, VERIFIED)
+            if linkedin_url:
+                return linkedin_url, outcome
+    finally:
+        ex.shutdown(wait=False, cancel_futures=True)
+    
+    return None, None
+
+@functools.lru_cache(maxsize=4096)
+def domain_label(url):
+    """First host label without "www." ("https://www.acme.co.uk/x" -> "acme")"""
+    match = _HOST_RE.match(url)
+    if match:
+        return match.group(1).lower()
+    # IPv6 literals, userinfo, missing scheme and other unusual shapes
+    host = urlparse(url).hostname or ""  # already lowercased
+    return host.replace("www.", "").split(".")[0]
+
+def canonical_url(url):
+    """Normalise a URL for cache keys: lowercase scheme/host, no trailing slash"""
+    try:
+        parsed = urlparse(url)
+        if not parsed.hostname:
+            return url.strip()
+        port = f":{parsed.port}" if parsed.port else ''
+    except ValueError:  # bad port or IPv6 literal; scraping reports the error
+        return url.strip()
+    host = f"[{parsed.hostname}]" if ':' in parsed.hostname else parsed.hostname  # hostname is lowercased
+    return f"{parsed.scheme.lower()}://{host}{port}{parsed.path.rstrip('/')}"
+
+# Results worth reusing for the life of the process, by canonical URL
+COMPANY_MEMO_SIZE = 1024
+_company_memo = {}
+_company_memo_lock = threading.Lock()
+
+def worth_caching(result):
+    """False for failed scrapes and ones whose LinkedIn page yielded no details"""
+    if result.keys() & {'error', 'linkedinError', 'linkedinUnverified'}:
+        return False
+    # The homepage supplies name and overview, so only the details show
+    # that the LinkedIn visit got past its auth wall
+    return not result.get('linkedin') or bool(result.keys() & set(LINKEDIN_FIELDS.values()))
+
 def scrape_company(url):
-    print(f"Scraping company: {url}")
+    """Scrape a company, reusing results from this process or a recent run.
+
+    The canonical URL is only the cache key; the URL as given is what gets
+    fetched and reported. Results worth_caching() rejects are never
+    reused, so the next call tries again.
+    """
+    key = canonical_url(url)
+    result = _company_memo.get(key)
+    if result is None:
+        result = CACHE.get(f"company:{key}")
+    if result is None:
+        result = _scrape_company(url)
+        if not worth_caching(result):
+            return result
+        CACHE.set(f"company:{key}", result, ttl=COMPANY_TTL)
+    with _company_memo_lock:
+        if key not in _company_memo and len(_company_memo) >= COMPANY_MEMO_SIZE:
+            del _company_memo[next(iter(_company_memo))]  # oldest entry
+        _company_memo[key] = result
+    return {**result, 'url': url}
+
+def _scrape_company(url):
+    log.debug("Scraping company: %s", url)
     
     try:
-        doc = fetch_page(url, use_js=True)
         out = {'url': url}
         
         # homepage selectors
         host = urlparse(url).hostname or ''
         host_key = host.replace('www.', '')
-        print(f"HOST KEY: {host_key}")
+        log.debug("HOST KEY: %s", host_key)
         
-        cfg = SELECTORS.get(host_key) or SELECTORS['default']
-        print(f"Using config: {cfg}")
+        cfg = RESOLVED_SELECTORS.get(host_key) or RESOLVED_SELECTORS['default']
+        needs_js = cfg.get('needs_js', False)
+        doc = fetch_homepage(url, needs_js)
         
-        container_sel = cfg.get('container', 'body')
-        el = (doc.select(container_sel) or [doc])[0]
+        extract_overview = OVERVIEW_EXTRACTORS.get(host_key) or OVERVIEW_EXTRACTORS['default']
 
         # name via selectors or title
         name = extract_name_from_title(doc, url)
-        print(f"Initially extracted name: {name}")
+        log.debug("Initially extracted name: %s", name)
         
         # Step 2: Validate extracted name against URL
         url_expected_name = extract_company_name_from_url(url)
-        print(f"URL suggests company name: {url_expected_name}")
+        log.debug("URL suggests company name: %s", url_expected_name)
         
         name_is_valid = validate_name_against_url(name, url)
         
@@ -627,180 +1406,111 @@ def scrape_company(url):
         linkedin_url = None
         
         if not name_is_valid and url_expected_name:
-            print(f"Name '{name}' doesn't match URL expectation. Trying LinkedIn fallback...")
+            log.debug("Name '%s' doesn't match URL expectation. Trying LinkedIn fallback...", name)
             
             # Search for LinkedIn page using URL-based name
             linkedin_url = search_engines_for_linkedin(url_expected_name)
             
             if linkedin_url:
-                # Verify the LinkedIn URL
-                verified_url = verify_linkedin_url([linkedin_url])
-                if verified_url:
-                    linkedin_url = verified_url
-                    print(f"Found LinkedIn URL via search: {linkedin_url}")
-                    
-                    # Extract name from LinkedIn using merged function
-                    linkedin_info = scrape_linkedin_info(linkedin_url, need_overview=False, extract_name=True)
-                    if linkedin_info.get('name'):
-                        print(f"Using LinkedIn name: {linkedin_info['name']}")
-                        final_name = linkedin_info['name']
-                    else:
-                        print(f"Could not extract name from LinkedIn, using URL-based name: {url_expected_name}")
-                        final_name = url_expected_name
+                # Search hits are trusted as-is; scraping the page is the check
+                log.debug("Found LinkedIn URL via search: %s", linkedin_url)
+                
+                # Extract name from LinkedIn using merged function
+                linkedin_info = scrape_linkedin_info(linkedin_url, need_overview=False, extract_name=True)
+                if linkedin_info.get('name'):
+                    log.debug("Using LinkedIn name: %s", linkedin_info['name'])
+                    final_name = linkedin_info['name']
                 else:
-                    print(f"LinkedIn URL verification failed, using URL-based name: {url_expected_name}")
+                    log.debug("Could not extract name from LinkedIn, using URL-based name: %s", url_expected_name)
                     final_name = url_expected_name
             else:
-                print(f"No LinkedIn URL found via search, using URL-based name: {url_expected_name}")
+                log.debug("No LinkedIn URL found via search, using URL-based name: %s", url_expected_name)
                 final_name = url_expected_name
 
         out['name'] = final_name
-        print(f"Extracted name: {name}")
+        log.debug("Extracted name: %s", name)
         
-        # overview - FIX: Handle the selector parsing correctly
-        overview = ''
-        if cfg.get('overview'):
-            selector_config = cfg['overview']
-            print(f"Overview selector config: {selector_config}")
-            
-            # Parse selector::attribute format
-            if '::' in selector_config:
-                selector, attribute = selector_config.split('::', 1)
-            else:
-                selector = selector_config
-                attribute = 'text'
-            
-            print(f"Using selector: {selector}, attribute: {attribute}")
-            
-            # Find element
-            element = el.select_one(selector)
-            if element:
-                if attribute == 'content':
-                    overview = element.get('content', '')
-                elif attribute == 'text':
-                    overview = element.get_text().strip()
-                else:
-                    overview = element.get(attribute, '')
-                print(f"Found overview: {overview}")
-            else:
-                print(f"No element found with selector: {selector}")
-                
-                # Fallback: try common meta description selectors
-                fallback_selectors = [
-                    'meta[name="description"]',
-                    'meta[property="og:description"]',
-                    'meta[name="twitter:description"]',
-                    '.company-description',
-                    '.about-us',
-                    '.overview'
-                ]
-                
-                for fallback in fallback_selectors:
-                    elem = doc.select_one(fallback)
-                    if elem:
-                        if fallback.startswith('meta'):
-                            overview = elem.get('content', '')
-                        else:
-                            overview = elem.get_text().strip()
-                        if overview:
-                            print(f"Found overview with fallback selector {fallback}: {overview[:100]}...")
-                            break
+        overview = extract_overview(doc)
         
         # Check if overview is insufficient
         need_linkedin_overview = is_overview_empty_or_insufficient(overview)
         if need_linkedin_overview:
-            print(f"Overview is insufficient, will try to get from LinkedIn")
+            log.debug("Overview is insufficient, will try to get from LinkedIn")
         
         out['overview'] = overview
         
         # Strategy 2: Search entire page for LinkedIn links
         if not linkedin_url:
-            linkedin_links = doc.select('a[href*="linkedin.com"]')
-            if linkedin_links:
-                for link in linkedin_links:
-                    href = link.get('href')
-                    if href:
-                        href = str(href)
-                        if '/company/' in href:
-                            linkedin_url = href if href.startswith('http') else urljoin(url, href)
-                            break
-        
-        # Strategy 3: Search Google/DuckDuckGo for LinkedIn company page
-        if not linkedin_url and name:
-            print(f"Searching search engines for LinkedIn page of: {name}")
-            linkedin_url = search_engines_for_linkedin(name)
-            # Verify the found URL
-            if linkedin_url:
-                verified_url = verify_linkedin_url([linkedin_url])
-                linkedin_url = verified_url
-
-        # Strategy 4: Check common pages for LinkedIn links
+            linkedin_url = first_linkedin_link(doc, url)
+        
+        # A previous run may already have resolved this host the slow way
+        # (strategies 3-5)
+        cache_key = f"linkedin:{host_key}"
         if not linkedin_url:
-            linkedin_url = find_linkedin_in_subpages(url, name)
+            linkedin_url = CACHE.get(cache_key)
+            if linkedin_url:
+                log.debug("Using cached LinkedIn URL: %s", linkedin_url)
         
-        # Strategy 5: Generate LinkedIn URL from company name
-        if not linkedin_url and name:
-            potential_urls = generate_linkedin_url(name)
-            if potential_urls:
-                linkedin_url = verify_linkedin_url(potential_urls)
+        # Strategies 3-5: search engines, common subpages, generated URLs
+        linkedin_outcome = VERIFIED
+        if not linkedin_url:
+            linkedin_url, linkedin_outcome = find_linkedin_elsewhere(url, name)
+            # Remember a slow-path find, but not a guess only LinkedIn's bot
+            # wall answered; a later run checks that one again. Cache hits
+            # aren't rewritten, so the entry still expires on schedule
+            if linkedin_url and linkedin_outcome != UNVERIFIED:
+                CACHE.set(cache_key, linkedin_url)
         
         out['linkedin'] = linkedin_url
-        print(f"Final LinkedIn URL: {linkedin_url}")
+        log.debug("Final LinkedIn URL: %s", linkedin_url)
+        unverified = linkedin_outcome == UNVERIFIED
+        if unverified:
+            out['linkedinUnverified'] = True
         
         # LinkedIn enrichment - ENHANCED to handle overview fallback
         if linkedin_url:
             try:
-                print("Attempting to scrape LinkedIn info...")
+                log.debug("Attempting to scrape LinkedIn info...")
                 extract_name = bool(linkedin_url) and not bool(final_name)
-                li_info = scrape_linkedin_info(linkedin_url, need_overview=need_linkedin_overview, extract_name=extract_name)
+                li_info = scrape_linkedin_info(linkedin_url, need_overview=need_linkedin_overview,
+                                               extract_name=extract_name, cache=not unverified)
                 
                 # If we got a better overview from LinkedIn, use it
                 if need_linkedin_overview and li_info.get('overview'):
-                    print(f"Using LinkedIn overview instead of homepage overview")
+                    log.debug("Using LinkedIn overview instead of homepage overview")
                     out['overview'] = li_info['overview']
                     # Remove overview from li_info to avoid duplication
                     li_info.pop('overview', None)
                 
                 out.update(li_info)
-                print(f"LinkedIn info extracted: {li_info}")
+                log.debug("LinkedIn info extracted: %s", li_info)
             except Exception as e:
-                print(f"LinkedIn scraping error: {e}")
+                log.warning("LinkedIn scraping error: %s", e)
                 out['linkedinError'] = str(e)
         elif need_linkedin_overview:
-            print(f"Warning: No LinkedIn URL found but overview is insufficient")
+            log.warning("No LinkedIn URL found but overview is insufficient")
             out['overviewWarning'] = "Overview is insufficient and no LinkedIn URL found for fallback"
         
         return out
         
     except Exception as e:
-        print(f"Error scraping company: {e}")
+        log.warning("Error scraping company: %s", e)
         return {'url': url, 'error': str(e)}
 
+@functools.lru_cache(maxsize=4096)
 def extract_company_name_from_url(url):
     """Extract expected company name from URL domain using string manipulation"""
     try:
-        host = urlparse(url).hostname or ""
-        domain = host.replace("www.", "").split(".")[0]
+        domain = domain_label(url)
         
         # Simple string manipulation to make it presentable
         # Handle common patterns like hyphens, underscores, numbers
         clean_domain = domain.lower()
         
-        # Remove common prefixes/suffixes that aren't part of company name
-        prefixes_to_remove = ['get', 'my', 'the', 'app', 'web', 'site', 'go', 'try']
-        suffixes_to_remove = ['app', 'web', 'site', 'io', 'ai', 'tech', 'co', 'inc']
-        
-        # Remove prefixes
-        for prefix in prefixes_to_remove:
-            if clean_domain.startswith(prefix) and len(clean_domain) > len(prefix):
-                clean_domain = clean_domain[len(prefix):]
-                break
-        
-        # Remove suffixes (but keep them if they're the entire domain)
-        for suffix in suffixes_to_remove:
-            if clean_domain.endswith(suffix) and len(clean_domain) > len(suffix):
-                clean_domain = clean_domain[:-len(suffix)]
-                break
+        # Remove one common prefix and one suffix that aren't part of the
+        # company name (but keep them if they're the entire domain)
+        clean_domain = _DOMAIN_PREFIX_RE.sub('', clean_domain, count=1)
+        clean_domain = _DOMAIN_SUFFIX_RE.sub('', clean_domain, count=1)
         
         # Handle special characters
         if '-' in clean_domain:
@@ -816,65 +1526,173 @@ def extract_company_name_from_url(url):
             return clean_domain.capitalize()
         
     except Exception as e:
-        print(f"Error extracting name from URL: {e}")
+        log.warning("Error extracting name from URL: %s", e)
         return None
 
+NAME_SIMILARITY_CUTOFF = 60  # whole-string fuzz.ratio score (0-100) that counts as a match
+
+@functools.lru_cache(maxsize=4096)
 def validate_name_against_url(extracted_name, url):
     """Check if extracted name reasonably matches the URL domain"""
     if not extracted_name or not url:
         return False
     
     try:
-        host = urlparse(url).hostname or ""
-        domain = host.replace("www.", "").split(".")[0].lower()
+        domain = domain_label(url)
         extracted_lower = extracted_name.lower()
         
-        # Remove common punctuation for comparison
-        clean_extracted = re.sub(r'[^\w\s]', '', extracted_lower)
-        clean_extracted = re.sub(r'\s+', '', clean_extracted)
+        # Remove punctuation and spaces for comparison; the table only knows
+        # ASCII whitespace, so \xa0, \u2009 and friends go through _WS_RE
+        clean_extracted = _WS_RE.sub('', extracted_lower.translate(_PUNCT_TABLE))
         
         # Direct match
         if domain in clean_extracted or clean_extracted in domain:
             return True
         
-        # Check if domain parts match extracted name parts
-        if '-' in domain:
-            domain_parts = domain.split('-')
-            extracted_parts = extracted_name.lower().split()
-            
-            # Check if any domain part matches any extracted part
-            for domain_part in domain_parts:
-                for extracted_part in extracted_parts:
-                    if domain_part in extracted_part or extracted_part in domain_part:
-                        return True
+        extracted_words = extracted_lower.split()
+        
+        # Check if any domain part matches any extracted part
+        if '-' in domain and any(dp in ep or ep in dp
+                                 for dp in domain.split('-')
+                                 for ep in extracted_words):
+            return True
         
         # Check reverse - if extracted name has multiple words, see if domain contains any
-        extracted_words = extracted_name.lower().split()
-        if len(extracted_words) > 1:
-            for word in extracted_words:
-                if len(word) > 2 and word in domain:  # Avoid matching short words like "a", "the"
-                    return True
-        
-        # Fuzzy matching for slight variations
-        similarity_threshold = 0.6
+        # (skipping short words like "a", "the")
+        if len(extracted_words) > 1 and any(len(w) > 2 and w in domain for w in extracted_words):
+            return True
+        
+        # Whole-string similarity for slight variations ("acmewidgts" vs "acmewidgets"); 0 below the cutoff
         if len(clean_extracted) > 3 and len(domain) > 3:
-            # Simple similarity check
-            common_chars = sum(1 for c in clean_extracted if c in domain)
-            similarity = common_chars / max(len(clean_extracted), len(domain))
-            if similarity >= similarity_threshold:
+            if fuzz.ratio(clean_extracted, domain, score_cutoff=NAME_SIMILARITY_CUTOFF):
                 return True
         
         return False
         
     except Exception as e:
-        print(f"Error validating name against URL: {e}")
+        log.warning("Error validating name against URL: %s", e)
         return False
 
+# -- BATCH --
+async def ascrape_companies(urls, concurrency=8):
+    """Awaitable scrape_many for callers already running an event loop."""
+    return await asyncio.to_thread(scrape_many, urls, concurrency)
+
+def scrape_many(urls, workers=8):
+    """Scrape many companies on a thread pool; results come back in input order.
+
+    URLs that canonicalise to the same company are scraped once, so
+    duplicates in a batch don't race each other past the cache.
+    """
+    return list(iter_scrape(urls, workers))
+
+def iter_scrape(urls, workers=8):
+    """Like scrape_many, but yield each result once it and every earlier one are done"""
+    keys = [canonical_url(u) for u in urls]
+    # First URL given for each company, in first-seen order
+    unique = {}
+    for key, url in zip(keys, urls):
+        unique.setdefault(key, url)
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        finished = zip(unique, ex.map(scrape_company, unique.values()))
+        results = {}
+        for key, url in zip(keys, urls):
+            # unique is in first-seen order, so nothing needed later is skipped
+            while key not in results:
+                done_key, result = next(finished)
+                results[done_key] = result
+            yield {**results[key], 'url': url}
+
 # -- MAIN --
-if __name__ == '__main__':
-    if len(sys.argv) != 2:
-        print('Usage: python scraper.py <URL>')
+def read_url_file(path):
+    """URLs from a file ('-' for stdin), one per line; blank lines and # comments are skipped"""
+    with (open(path) if path != '-' else contextlib.nullcontext(sys.stdin)) as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+
+def write_json(result):
+    """Pretty-print a result to stdout, via orjson when it is installed"""
+    if orjson is None:
+        print(json.dumps(result, indent=2))
+        return
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(result, option=orjson.OPT_INDENT_2) + b"\n")
+    sys.stdout.flush()
+
+def write_json_line(result):
+    """Write a result as one compact line of newline-delimited JSON and flush it"""
+    if orjson is None:
+        sys.stdout.write(json.dumps(result) + "\n")
+    else:
+        sys.stdout.buffer.write(orjson.dumps(result) + b"\n")
+    sys.stdout.flush()
+
+class _RawQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that enqueues the record as is instead of formatting it first.
+
+    The stock prepare() does the %-interpolation in the logging thread; the
+    listener is in this process, so the record needs no pickling cleanup.
+    """
+
+    def prepare(self, record):
+        return record
+
+def setup_logging(level):
+    """Log through a queue: scraper threads only enqueue records, and one
+    listener thread formats them and writes to stderr."""
+    records = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    listener = logging.handlers.QueueListener(records, handler)
+    logging.basicConfig(level=level, handlers=[_RawQueueHandler(records)])
+    listener.start()
+    atexit.register(listener.stop)
+
+def positive_int(value):
+    """argparse type for counts that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return number
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scrape company details from a homepage and its LinkedIn page")
+    parser.add_argument('urls', nargs='*', metavar='URL')
+    parser.add_argument('--batch', metavar='FILE',
+                        help="read URLs from FILE, one per line ('-' for stdin)")
+    parser.add_argument('-j', '--jobs', type=positive_int, default=8,
+                        help='companies to scrape in parallel (default: 8)')
+    parser.add_argument('--ndjson', action='store_true',
+                        help='print one JSON object per line as each company finishes')
+    args = parser.parse_args(argv)
+    setup_logging(os.environ.get("SCRAPER_LOG", "WARNING").upper())
+    install_dns_cache()
+    
+    # A "-" among the URLs reads more of them from stdin
+    batches = [args.batch] if args.batch else []
+    if '-' in args.urls and '-' not in batches:
+        batches.append('-')
+    urls = [u for u in args.urls if u != '-']
+    for batch in batches:
+        urls.extend(read_url_file(batch))
+    if not urls:
+        parser.print_usage()
         sys.exit(1)
     
-    result = scrape_company(sys.argv[1])
-    print(json.dumps(result, indent=2))
\ No newline at end of file
+    if len(urls) == 1 and not batches:
+        result = scrape_company(urls[0])
+        (write_json_line if args.ndjson else write_json)(result)
+        return
+    
+    # One warm browser per worker thread
+    DRIVERS.size = args.jobs
+    if args.ndjson:
+        for result in iter_scrape(urls, workers=args.jobs):
+            write_json_line(result)
+    else:
+        write_json(scrape_many(urls, workers=args.jobs))
+
+if __name__ == '__main__':
+    main()
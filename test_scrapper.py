@@ -0,0 +1,190 @@
+import contextlib
+import json
+import time
+from urllib.parse import urlparse
+
+import pytest
+
+import scrapper
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """A fresh on-disk CACHE for the test"""
+    disk = scrapper._DiskCache(str(tmp_path / "cache"), scrapper.CACHE_TTL)
+    monkeypatch.setattr(scrapper, "CACHE", disk)
+    yield disk
+    disk.close()
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('<a href="https://www.linkedin.com/company/acme/">', "https://www.linkedin.com/company/acme"),
+    ('/url?q=https://uk.linkedin.com/company/acme-widgets&sa=U', "https://www.linkedin.com/company/acme-widgets"),
+    # DuckDuckGo redirect, slashes and slug percent-encoded
+    ('/l/?uddg=https%3A%2F%2Fwww.linkedin.com%2Fcompany%2Facme%2Dinc%2F&amp;rut=1',
+     "https://www.linkedin.com/company/acme-inc"),
+    # Non-ASCII slugs come out encoded once however they went in
+    ('linkedin.com/company/caf%C3%A9-co?x', "https://www.linkedin.com/company/caf%C3%A9-co"),
+    ('linkedin.com/company/caf%25C3%25A9-co"', "https://www.linkedin.com/company/caf%C3%A9-co"),
+    ('linkedin.com/company/café-co"', "https://www.linkedin.com/company/caf%C3%A9-co"),
+    ('linkedin.com/company/50%25-off"', "https://www.linkedin.com/company/50%25-off"),
+    ('linkedin.com/in/someone', None),
+])
+def test_linkedin_company_url_in(text, expected):
+    assert scrapper.linkedin_company_url_in(text) == expected
+
+
+def _domain_label_urlparse(url):
+    """domain_label as it was before _HOST_RE"""
+    host = urlparse(url).hostname or ""
+    return host.replace("www.", "").split(".")[0]
+
+@pytest.mark.parametrize("url", [
+    "https://www.acme.co.uk/x",
+    "https://www.www.acme.com",
+    "HTTPS://WWW.Acme.COM",
+    "https://acme.com:8443/a",
+    "https://acme.com?q=1",
+    "https://acme#top",
+    "http://[::1]:8080/",
+    "http://[2001:db8::1]/",
+    "https://user:pw@acme.com/",
+    "https://user@www.acme.com",
+    "https://www.evil.com@acme.com/",
+    "acme.com",
+    "ftp://www.acme.com",
+])
+def test_domain_label_matches_urlparse(url):
+    assert scrapper.domain_label(url) == _domain_label_urlparse(url)
+
+
+def _strip_affixes_loop(domain):
+    """Prefix/suffix removal as it was before the anchored regexes"""
+    for prefix in ['get', 'my', 'the', 'app', 'web', 'site', 'go', 'try']:
+        if domain.startswith(prefix) and len(domain) > len(prefix):
+            domain = domain[len(prefix):]
+            break
+    for suffix in ['app', 'web', 'site', 'io', 'ai', 'tech', 'co', 'inc']:
+        if domain.endswith(suffix) and len(domain) > len(suffix):
+            domain = domain[:-len(suffix)]
+            break
+    return domain
+
+@pytest.mark.parametrize("domain", [
+    "acme", "getacme", "acmeapp", "myacmeapp", "go-acme", "tryit",
+    "app", "get", "io", "appapp", "theco", "apple", "webco", "acme_co",
+])
+def test_domain_affixes_match_loop(domain):
+    expected = _strip_affixes_loop(domain).replace('-', '').replace('_', '')
+    got = scrapper.extract_company_name_from_url(f"https://{domain}.com")
+    assert got.lower().replace(' ', '') == expected
+
+
+def test_generate_linkedin_url_known_priority():
+    # The old if/elif chain checked google before apple
+    assert scrapper.generate_linkedin_url("Apple and Google")[-1] == \
+        "https://www.linkedin.com/company/google"
+    assert scrapper.generate_linkedin_url("Facebook")[-1] == "https://www.linkedin.com/company/meta"
+    assert len(scrapper.generate_linkedin_url("Acme")) == 4
+
+
+def test_iter_scrape_order_and_duplicates(monkeypatch):
+    calls = []
+
+    def fake_scrape(url):
+        calls.append(url)
+        # The first company finishes last
+        time.sleep(0.05 if "a.com" in url else 0)
+        return {'url': url, 'name': urlparse(url).hostname}
+
+    monkeypatch.setattr(scrapper, "scrape_company", fake_scrape)
+    urls = ["https://a.com", "https://b.com/", "https://A.com/", "https://b.com"]
+    results = list(scrapper.iter_scrape(urls, workers=4))
+
+    assert sorted(calls) == ["https://a.com", "https://b.com/"]
+    assert [r['url'] for r in results] == urls
+    assert [r['name'] for r in results] == ["a.com", "b.com", "a.com", "b.com"]
+
+
+class _Response:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+@pytest.mark.parametrize("status, outcome, cached", [
+    (200, scrapper.VERIFIED, True),
+    (scrapper.LINKEDIN_BOT_WALL, scrapper.UNVERIFIED, None),
+    (404, None, False),
+    (429, None, None),
+])
+def test_check_linkedin_url(cache, monkeypatch, status, outcome, cached):
+    url = "https://www.linkedin.com/company/acme"
+    monkeypatch.setattr(scrapper.SESSION, "get",
+                        lambda *a, **kw: contextlib.nullcontext(_Response(status)))
+    assert scrapper.check_linkedin_url(url) == outcome
+    # Only definite answers are remembered; the bot wall is asked again
+    assert cache.get(f"verify:{url}") is cached
+
+def test_verify_linkedin_url_prefers_list_order(cache, monkeypatch):
+    statuses = {"https://www.linkedin.com/company/a": scrapper.LINKEDIN_BOT_WALL,
+                "https://www.linkedin.com/company/b": 200}
+    monkeypatch.setattr(scrapper.SESSION, "get",
+                        lambda url, **kw: contextlib.nullcontext(_Response(statuses[url])))
+    assert scrapper.verify_linkedin_url(list(statuses)) == \
+        ("https://www.linkedin.com/company/a", scrapper.UNVERIFIED)
+    assert scrapper.verify_linkedin_url(["https://www.linkedin.com/company/b"]) == \
+        ("https://www.linkedin.com/company/b", scrapper.VERIFIED)
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("HTTPS://Acme.COM/About/", "https://acme.com/About"),
+    ("https://acme.com:8443/x/", "https://acme.com:8443/x"),
+    ("http://[::1]:8080/a/", "http://[::1]:8080/a"),
+    # Bad ports and broken IPv6 literals come back as given, for the scrape to report
+    ("https://acme.com:99999/", "https://acme.com:99999/"),
+    ("https://acme.com:abc/", "https://acme.com:abc/"),
+    ("http://[::1/", "http://[::1/"),
+    (" acme.com/ ", "acme.com/"),
+])
+def test_canonical_url(url, expected):
+    assert scrapper.canonical_url(url) == expected
+
+def test_scrape_company_reuses_only_good_results(cache, monkeypatch):
+    calls = []
+
+    def fake_scrape(url):
+        calls.append(url)
+        if "flaky" in url:
+            return {'url': url, 'error': 'timed out'}
+        if "walled" in url:
+            return {'url': url, 'name': 'Walled', 'linkedin': 'https://www.linkedin.com/company/walled'}
+        return {'url': url, 'name': 'Acme'}
+
+    monkeypatch.setattr(scrapper, "_scrape_company", fake_scrape)
+    monkeypatch.setattr(scrapper, "_company_memo", {})
+    assert scrapper.scrape_company("https://Acme.com/")['url'] == "https://Acme.com/"
+    assert scrapper.scrape_company("https://acme.com")['url'] == "https://acme.com"
+    for url in ["https://flaky.com", "https://flaky.com", "https://walled.com", "https://walled.com"]:
+        scrapper.scrape_company(url)
+    assert calls == ["https://Acme.com/", "https://flaky.com", "https://flaky.com",
+                     "https://walled.com", "https://walled.com"]
+
+
+def test_linkedin_details_from_jsonld():
+    org = {'@type': 'Organization', 'industry': ['Software', 'IT'],
+           'numberOfEmployees': {'minValue': 1001, 'maxValue': 5000}, 'foundingDate': '1999'}
+    blobs = [json.dumps({'@graph': [{'@type': 'WebPage'}, org]}), 'not json', None]
+    assert scrapper.linkedin_details_from_jsonld(blobs) == {
+        'industry': 'Software, IT', 'companySize': '1001-5000', 'foundedDate': '1999'}
+    # The first blob to have a field wins
+    blobs = [json.dumps([{'numberOfEmployees': {'value': 250}}]), json.dumps({'industry': 'Later'})]
+    assert scrapper.linkedin_details_from_jsonld(blobs) == {'companySize': '250', 'industry': 'Later'}
+
+
+def test_linkedin_details_from_rows():
+    rows = [('Industry ', '  Software\n Development'), ('Company size', '1,001-5,000 employees'),
+            ('Founded', '2004'), ('Industry', 'Other'), ('Headquarters', 'Berlin'),
+            (None, 'orphan'), ('Founded', None)]
+    assert scrapper.linkedin_details_from_rows(rows) == {
+        'industry': 'Software Development', 'companySize': '1,001-5,000', 'foundedDate': '2004'}
+    # No number in the size and one-character values are dropped
+    assert scrapper.linkedin_details_from_rows([('Company size', 'about a dozen'), ('Founded', '7')]) == {}